@@ -1,16 +1,22 @@
+import io
 import os
+import re
 import json
 import uuid
 import random
+import ssl
 import requests
 from hashlib import sha1
 import argparse
 import time
 import zipfile
 import subprocess
+import mmap
 import shutil
 import tempfile
-from concurrent.futures import ThreadPoolExecutor
+import functools
+from dataclasses import dataclass
+from concurrent.futures import ThreadPoolExecutor, as_completed
 import urllib.request
 import urllib.parse
 import platform
@@ -20,6 +26,20 @@ from pathlib import Path
 import sys
 import tty
 import termios
+import select
+import threading
+
+
+try:
+    import orjson
+
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+
+_SYSTEM = platform.system()
+_IS_WINDOWS = _SYSTEM == "Windows"
 
 
 ARCHITECTURES = {
@@ -44,26 +64,39 @@ STORES = {
 }
 
 
+DOWNLOAD_CHUNK_SIZE = int(os.environ.get("IAD_HTTP_CHUNK", 256 * 1024))
+
 TOOLS_CONFIG = {
     "apkeditor": {
+        "name": "APKEditor",
         "repo": "REAndroid/APKEditor",
         "filename": "APKEditor.jar",
         "pattern": r"APKEditor-.*\.jar$",
     },
     "uber_signer": {
+        "name": "Uber APK Signer",
         "repo": "patrickfav/uber-apk-signer",
         "filename": "uber-apk-signer.jar",
         "pattern": r"uber-apk-signer-.*\.jar$",
     },
 }
 
+for _tool in TOOLS_CONFIG.values():
+    _tool["pattern_re"] = re.compile(_tool["pattern"])
+
+
+@functools.lru_cache(maxsize=None)
+def _first_existing(paths):
+    """Return the first existing path from a tuple of candidates, cached"""
+    return next((path for path in paths if os.path.exists(path)), None)
+
 
 def get_user_config_dir():
     """Get user configuration directory"""
     home = Path.home()
-    if platform.system() == "Windows":
+    if _IS_WINDOWS:
         config_dir = home / "AppData" / "Local" / "IranianAppDownloader"
-    elif platform.system() == "Darwin":
+    elif _SYSTEM == "Darwin":
         config_dir = home / "Library" / "Application Support" / "IranianAppDownloader"
     else:
         config_dir = home / ".config" / "IranianAppDownloader"
@@ -81,131 +114,163 @@ class ToolInstaller:
         self.tools_dir.mkdir(exist_ok=True)
         self.session = requests.Session()
         self.session.headers.update({"User-Agent": "Iranian-App-Downloader/1.0"})
+        adapter = requests.adapters.HTTPAdapter(pool_connections=8, pool_maxsize=8)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        self.tools_meta_path = self.config_dir / "tools.json"
+        self.tools_meta = self._load_tools_meta()
+        self._meta_lock = threading.Lock()
+
+    def _load_tools_meta(self):
+        """Load cached release metadata for installed tools"""
+        try:
+            with open(self.tools_meta_path) as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def _save_tools_meta(self):
+        # Installs can finish concurrently; don't let two writers interleave
+        with self._meta_lock:
+            with open(self.tools_meta_path, "w") as f:
+                json.dump(self.tools_meta, f)
 
-    def get_github_latest_release(self, repo):
-        """Get latest release info from GitHub"""
+    def get_github_latest_release(self, repo, etag=None):
+        """Get latest release info from GitHub (None on failure or 304)"""
         try:
             url = f"https://api.github.com/repos/{repo}/releases/latest"
-            response = self.session.get(url)
+            headers = {"If-None-Match": etag} if etag else None
+            response = self.session.get(url, headers=headers)
+            if response.status_code == 304:
+                return None
             response.raise_for_status()
-            return response.json()
+            release_info = response.json()
+            release_info["_etag"] = response.headers.get("ETag")
+            return release_info
         except Exception as e:
             print(f"❌ Failed to get release info for {repo}: {e}")
             return None
 
-    def download_file_with_progress(self, url, filepath):
-        """Download file with progress bar"""
+    def download_to_fileobj(self, url, fileobj, name, zero_copy=False, quiet=False):
+        """Download a URL into an open file object with progress bar
+
+        With quiet=True only plain start/finish lines are printed, so
+        concurrent downloads don't fight over the progress-bar line.
+        """
         try:
             response = self.session.get(url, stream=True)
             response.raise_for_status()
 
             total_size = int(response.headers.get("content-length", 0))
-            filename = filepath.name
-
-            if total_size > 0:
-                progress = ProgressBar(total_size, f"📥 {filename}")
-
-                with open(filepath, "wb") as f:
-                    for chunk in response.iter_content(chunk_size=8192):
-                        if chunk:
-                            f.write(chunk)
-                            progress.update(len(chunk))
+            response.raw.decode_content = True
+
+            if total_size > 0 and not quiet:
+                progress = ProgressBar(total_size, f"📥 {name}")
+
+                if not (
+                    zero_copy
+                    and _splice_download(response, fileobj, total_size, progress)
+                ):
+                    shutil.copyfileobj(
+                        response.raw,
+                        _ProgressWriter(fileobj, progress),
+                        length=DOWNLOAD_CHUNK_SIZE,
+                    )
                 progress.finish()
             else:
 
-                print(f"📥 Downloading {filename}...")
-                with open(filepath, "wb") as f:
-                    for chunk in response.iter_content(chunk_size=8192):
-                        if chunk:
-                            f.write(chunk)
-                print(f"✅ Downloaded {filename}")
+                print(f"📥 Downloading {name}...")
+                if not (
+                    zero_copy
+                    and total_size > 0
+                    and _splice_download(response, fileobj, total_size, _NULL_PROGRESS)
+                ):
+                    shutil.copyfileobj(
+                        response.raw, fileobj, length=DOWNLOAD_CHUNK_SIZE
+                    )
+                print(f"✅ Downloaded {name}")
 
             return True
         except Exception as e:
             print(f"❌ Download failed: {e}")
             return False
 
-    def install_apkeditor(self):
-        """Install APKEditor.jar"""
-        config = TOOLS_CONFIG["apkeditor"]
+    def download_file_with_progress(self, url, filepath, quiet=False):
+        """Download file with progress bar"""
+        with open(filepath, "wb") as f:
+            return self.download_to_fileobj(
+                url, f, filepath.name, zero_copy=True, quiet=quiet
+            )
+
+    def _install_jar_tool(self, tool_key, release_info=None, quiet=False):
+        """Install a jar tool described by TOOLS_CONFIG"""
+        config = TOOLS_CONFIG[tool_key]
+        name = config["name"]
         target_path = self.tools_dir / config["filename"]
+        cached = self.tools_meta.get(tool_key, {})
 
         if target_path.exists():
-            print(f"✅ APKEditor already installed at {target_path}")
-            return str(target_path)
+            if not cached.get("size") or target_path.stat().st_size == cached["size"]:
+                print(f"✅ {name} already installed at {target_path}")
+                return str(target_path)
 
-        print("🔍 Getting APKEditor latest release...")
-        release_info = self.get_github_latest_release(config["repo"])
+            print(f"⚠️  {name} at {target_path} looks incomplete, reinstalling...")
 
-        if not release_info:
-            return None
+        if release_info is None:
+            print(f"🔍 Getting {name} latest release...")
+            release_info = self.get_github_latest_release(
+                config["repo"], cached.get("etag")
+            )
 
-        jar_asset = None
-        import re
+        if release_info:
+            jar_asset = None
+            pattern = config["pattern_re"]
 
-        pattern = re.compile(config["pattern"])
+            for asset in release_info.get("assets", []):
+                if pattern.match(asset["name"]):
+                    jar_asset = asset
+                    break
 
-        for asset in release_info.get("assets", []):
-            if pattern.match(asset["name"]):
-                jar_asset = asset
-                break
+            if not jar_asset:
+                print(f"❌ {name} jar file not found in release assets")
+                return None
+
+            tag_name = release_info["tag_name"]
+            meta = {
+                "tag": tag_name,
+                "url": jar_asset["browser_download_url"],
+                "size": jar_asset.get("size"),
+                "updated_at": jar_asset.get("updated_at"),
+                "etag": release_info.get("_etag"),
+            }
+        elif cached.get("url"):
 
-        if not jar_asset:
-            print("❌ APKEditor jar file not found in release assets")
+            tag_name = cached.get("tag", "(cached)")
+            meta = cached
+        else:
             return None
 
-        print(f"📦 Found APKEditor {release_info['tag_name']}")
+        print(f"📦 Found {name} {tag_name}")
 
-        if self.download_file_with_progress(
-            jar_asset["browser_download_url"], target_path
-        ):
-            print(f"✅ APKEditor installed to {target_path}")
+        if self.download_file_with_progress(meta["url"], target_path, quiet=quiet):
+            self.tools_meta[tool_key] = meta
+            self._save_tools_meta()
+            print(f"✅ {name} installed to {target_path}")
             return str(target_path)
 
         return None
 
-    def install_uber_signer(self):
-        """Install uber-apk-signer.jar"""
-        config = TOOLS_CONFIG["uber_signer"]
-        target_path = self.tools_dir / config["filename"]
-
-        if target_path.exists():
-            print(f"✅ Uber APK Signer already installed at {target_path}")
-            return str(target_path)
-
-        print("🔍 Getting Uber APK Signer latest release...")
-        release_info = self.get_github_latest_release(config["repo"])
-
-        if not release_info:
-            return None
-
-        jar_asset = None
-        import re
-
-        pattern = re.compile(config["pattern"])
-
-        for asset in release_info.get("assets", []):
-            if pattern.match(asset["name"]):
-                jar_asset = asset
-                break
-
-        if not jar_asset:
-            print("❌ Uber APK Signer jar file not found in release assets")
-            return None
-
-        print(f"📦 Found Uber APK Signer {release_info['tag_name']}")
-
-        if self.download_file_with_progress(
-            jar_asset["browser_download_url"], target_path
-        ):
-            print(f"✅ Uber APK Signer installed to {target_path}")
-            return str(target_path)
+    def install_apkeditor(self, release_info=None):
+        """Install APKEditor.jar"""
+        return self._install_jar_tool("apkeditor", release_info)
 
-        return None
+    def install_uber_signer(self, release_info=None):
+        """Install uber-apk-signer.jar"""
+        return self._install_jar_tool("uber_signer", release_info)
 
     def get_adb_download_url(self):
         """Get ADB platform-tools download URL for current OS"""
-        system = platform.system().lower()
+        system = _SYSTEM.lower()
 
         urls = {
             "windows": "https://dl.google.com/android/repository/platform-tools-latest-windows.zip",
@@ -215,10 +280,10 @@ class ToolInstaller:
 
         return urls.get(system)
 
-    def install_adb(self):
+    def install_adb(self, quiet=False):
         """Install ADB platform tools"""
         adb_dir = self.tools_dir / "platform-tools"
-        adb_exe = "adb.exe" if platform.system() == "Windows" else "adb"
+        adb_exe = "adb.exe" if _IS_WINDOWS else "adb"
         adb_path = adb_dir / adb_exe
 
         if adb_path.exists():
@@ -227,26 +292,26 @@ class ToolInstaller:
 
         download_url = self.get_adb_download_url()
         if not download_url:
-            print(f"❌ ADB download not available for {platform.system()}")
+            print(f"❌ ADB download not available for {_SYSTEM}")
             return None
 
         print("📥 Downloading Android Platform Tools (ADB)...")
 
-        zip_path = self.tools_dir / "platform-tools.zip"
-
-        if not self.download_file_with_progress(download_url, zip_path):
-            return None
-
         try:
-            print("📦 Extracting platform-tools...")
-            with zipfile.ZipFile(zip_path, "r") as zip_ref:
-                zip_ref.extractall(self.tools_dir)
+            with tempfile.SpooledTemporaryFile(max_size=64 * 1024 * 1024) as spooled:
+                if not self.download_to_fileobj(
+                    download_url, spooled, "platform-tools.zip", quiet=quiet
+                ):
+                    return None
 
-            zip_path.unlink()
+                print("📦 Extracting platform-tools...")
+                with zipfile.ZipFile(spooled, "r") as zip_ref:
+                    for info in zip_ref.infolist():
+                        zip_ref.extract(info, self.tools_dir)
 
             if adb_path.exists():
 
-                if platform.system() != "Windows":
+                if not _IS_WINDOWS:
                     os.chmod(adb_path, 0o755)
 
                 print(f"✅ ADB installed to {adb_path}")
@@ -271,6 +336,8 @@ class ToolInstaller:
             print("   Windows: Download from Oracle or use scoop/chocolatey")
             input("\nPress Enter after installing Java...")
 
+            # Drop the cached miss so the re-probe actually spawns java
+            _CAPABILITY_CACHE.pop("java", None)
             if not CapabilityChecker.check_java():
                 print("❌ Java still not detected. Skipping Java-dependent tools.")
                 java_available = False
@@ -341,13 +408,44 @@ class ToolInstaller:
         if tools_to_install:
             print(f"\n🔧 Installing {len(tools_to_install)} tools...")
 
-            for tool in tools_to_install:
-                if tool == "apkeditor":
-                    self.install_apkeditor()
-                elif tool == "uber_signer":
-                    self.install_uber_signer()
-                elif tool == "adb":
-                    self.install_adb()
+            jar_tools = [t for t in tools_to_install if t in TOOLS_CONFIG]
+            release_infos = {}
+            if jar_tools:
+                with ThreadPoolExecutor(max_workers=4) as executor:
+                    futures = {
+                        tool: executor.submit(
+                            self.get_github_latest_release, TOOLS_CONFIG[tool]["repo"]
+                        )
+                        for tool in jar_tools
+                    }
+                    release_infos = {
+                        tool: future.result() for tool, future in futures.items()
+                    }
+
+            # Progress bars redraw a single terminal line, so they only run
+            # when one tool installs at a time.
+            quiet = len(tools_to_install) > 1
+
+            with ThreadPoolExecutor(max_workers=3) as executor:
+                install_futures = []
+                for tool in tools_to_install:
+                    if tool == "adb":
+                        install_futures.append(
+                            executor.submit(self.install_adb, quiet)
+                        )
+                    else:
+                        install_futures.append(
+                            executor.submit(
+                                self._install_jar_tool,
+                                tool,
+                                release_infos.get(tool),
+                                quiet,
+                            )
+                        )
+                for future in install_futures:
+                    future.result()
+
+            CapabilityChecker.invalidate_cache()
 
         print("\n✅ Tool setup completed!")
         input("Press Enter to continue...")
@@ -360,60 +458,72 @@ class ToolInstaller:
             return self.tools_dir / TOOLS_CONFIG["uber_signer"]["filename"]
         elif tool_name == "adb":
             adb_dir = self.tools_dir / "platform-tools"
-            adb_exe = "adb.exe" if platform.system() == "Windows" else "adb"
+            adb_exe = "adb.exe" if _IS_WINDOWS else "adb"
             return adb_dir / adb_exe
         return None
 
 
+class _RawTTY:
+    """Put the terminal into cbreak mode for the duration of a menu"""
+
+    def __enter__(self):
+        self.fd = sys.stdin.fileno()
+        self.old_settings = termios.tcgetattr(self.fd)
+        tty.setcbreak(self.fd)
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        termios.tcsetattr(self.fd, termios.TCSADRAIN, self.old_settings)
+
+
 class InteractiveMenu:
     def __init__(self):
         self.selected = 0
 
     def get_key(self):
-        """Get a single keypress from terminal"""
-        fd = sys.stdin.fileno()
-        old_settings = termios.tcgetattr(fd)
-        try:
-            tty.setraw(sys.stdin.fileno())
-            key = sys.stdin.read(1)
-            if key == "\x1b":
-                key += sys.stdin.read(2)
-            return key
-        finally:
-            termios.tcsetattr(fd, termios.TCSADRAIN, old_settings)
+        """Get a single keypress (terminal must already be in raw mode)"""
+        key = sys.stdin.read(1)
+        if key == "\x1b":
+            key += sys.stdin.read(2)
+        return key
 
     def show_menu(self, title, options, descriptions=None):
         """Show interactive menu with arrow navigation"""
-        while True:
+        with _RawTTY():
+            while True:
 
-            os.system("clear" if os.name == "posix" else "cls")
+                sys.stdout.write("\x1b[H\x1b[J")
+                sys.stdout.flush()
 
-            print(f"\n{title}")
-            print("=" * len(title))
-            print("Use ↑/↓ arrows to navigate, Enter to select, q to quit\n")
+                print(f"\n{title}")
+                print("=" * len(title))
+                print("Use ↑/↓ arrows to navigate, Enter to select, q to quit\n")
 
-            for i, option in enumerate(options):
-                prefix = "→ " if i == self.selected else "  "
-                suffix = (
-                    f" - {descriptions[i]}"
-                    if descriptions and i < len(descriptions)
-                    else ""
-                )
-                if i == self.selected:
-                    print(f"\033[1;32m{prefix}{option}{suffix}\033[0m")
-                else:
-                    print(f"{prefix}{option}{suffix}")
+                for i, option in enumerate(options):
+                    prefix = "→ " if i == self.selected else "  "
+                    suffix = (
+                        f" - {descriptions[i]}"
+                        if descriptions and i < len(descriptions)
+                        else ""
+                    )
+                    if i == self.selected:
+                        print(f"\033[1;32m{prefix}{option}{suffix}\033[0m")
+                    else:
+                        print(f"{prefix}{option}{suffix}")
+
+                key = self.get_key()
+
+                if key == "\x1b[A":
+                    self.selected = (self.selected - 1) % len(options)
+                elif key == "\x1b[B":
+                    self.selected = (self.selected + 1) % len(options)
+                elif key == "\r" or key == "\n":
+                    return self.selected
+                elif key.lower() == "q" or key == chr(3):
+                    exit()
 
-            key = self.get_key()
 
-            if key == "\x1b[A":
-                self.selected = (self.selected - 1) % len(options)
-            elif key == "\x1b[B":
-                self.selected = (self.selected + 1) % len(options)
-            elif key == "\r" or key == "\n":
-                return self.selected
-            elif key.lower() == "q" or key == chr(3):
-                exit()
+_CAPABILITY_CACHE = {}
 
 
 class CapabilityChecker:
@@ -422,12 +532,21 @@ class CapabilityChecker:
     def __init__(self):
         self.installer = ToolInstaller()
 
+    @staticmethod
+    def invalidate_cache():
+        """Forget cached tool probes (call after installing tools)"""
+        _CAPABILITY_CACHE.clear()
+        _first_existing.cache_clear()
+
     @staticmethod
     def check_tool(tool_name):
         """Check if a tool is available in PATH"""
         try:
             result = subprocess.run(
-                [tool_name, "--version"], capture_output=True, text=True, timeout=5
+                [tool_name, "--version"],
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+                timeout=5,
             )
             return result.returncode == 0
         except (
@@ -440,52 +559,77 @@ class CapabilityChecker:
     @staticmethod
     def check_java():
         """Check if Java is available"""
+        if "java" in _CAPABILITY_CACHE:
+            return _CAPABILITY_CACHE["java"]
+
         try:
             result = subprocess.run(
-                ["java", "-version"], capture_output=True, text=True, timeout=5
+                ["java", "-version"],
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+                timeout=5,
             )
-            return result.returncode == 0
+            available = result.returncode == 0
         except:
-            return False
+            available = False
+
+        _CAPABILITY_CACHE["java"] = available
+        return available
 
     def find_apkeditor(self):
         """Find APKEditor.jar in common locations including installed tools"""
+        if "apkeditor" in _CAPABILITY_CACHE:
+            return _CAPABILITY_CACHE["apkeditor"]
 
         installed_path = self.installer.get_tool_path("apkeditor")
         if installed_path and installed_path.exists():
-            return str(installed_path)
-
-        paths = [
-            "APKEditor.jar",
-            "apkeditor.jar",
-            "tools/APKEditor.jar",
-            os.path.expanduser("~/APKEditor.jar"),
-            "/usr/local/bin/APKEditor.jar",
-        ]
-        return next((path for path in paths if os.path.exists(path)), None)
+            found = str(installed_path)
+        else:
+            paths = (
+                "APKEditor.jar",
+                "apkeditor.jar",
+                "tools/APKEditor.jar",
+                os.path.expanduser("~/APKEditor.jar"),
+                "/usr/local/bin/APKEditor.jar",
+            )
+            found = _first_existing(paths)
+
+        _CAPABILITY_CACHE["apkeditor"] = found
+        return found
 
     def find_uber_signer(self):
         """Find uber-apk-signer.jar"""
+        if "uber_signer" in _CAPABILITY_CACHE:
+            return _CAPABILITY_CACHE["uber_signer"]
+
         installed_path = self.installer.get_tool_path("uber_signer")
         if installed_path and installed_path.exists():
-            return str(installed_path)
+            found = str(installed_path)
+        else:
+            paths = (
+                "uber-apk-signer.jar",
+                "tools/uber-apk-signer.jar",
+                os.path.expanduser("~/uber-apk-signer.jar"),
+            )
+            found = _first_existing(paths)
 
-        paths = [
-            "uber-apk-signer.jar",
-            "tools/uber-apk-signer.jar",
-            os.path.expanduser("~/uber-apk-signer.jar"),
-        ]
-        return next((path for path in paths if os.path.exists(path)), None)
+        _CAPABILITY_CACHE["uber_signer"] = found
+        return found
 
     def check_adb(self):
         """Check if ADB is available and device connected"""
+        if "adb" in _CAPABILITY_CACHE:
+            return _CAPABILITY_CACHE["adb"]
 
         adb_cmd = "adb"
         adb_available = False
 
         try:
             result = subprocess.run(
-                [adb_cmd, "version"], capture_output=True, text=True, timeout=5
+                [adb_cmd, "version"],
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+                timeout=5,
             )
             if result.returncode == 0:
                 adb_available = True
@@ -496,7 +640,10 @@ class CapabilityChecker:
                 adb_cmd = str(installed_adb)
                 try:
                     result = subprocess.run(
-                        [adb_cmd, "version"], capture_output=True, text=True, timeout=5
+                        [adb_cmd, "version"],
+                        stdout=subprocess.DEVNULL,
+                        stderr=subprocess.DEVNULL,
+                        timeout=5,
                     )
                     if result.returncode == 0:
                         adb_available = True
@@ -504,23 +651,37 @@ class CapabilityChecker:
                     pass
 
         if not adb_available:
-            return False, "ADB not found"
+            status = (False, "ADB not found")
+        else:
+            try:
+                result = subprocess.run(
+                    [adb_cmd, "devices"], capture_output=True, text=True, timeout=10
+                )
+                if "device" in result.stdout and "offline" not in result.stdout:
+                    status = (True, "ADB ready with connected device")
+                else:
+                    status = (False, "No device connected to ADB")
+            except:
+                status = (False, "ADB connection failed")
 
-        try:
-            result = subprocess.run(
-                [adb_cmd, "devices"], capture_output=True, text=True, timeout=10
-            )
-            if "device" in result.stdout and "offline" not in result.stdout:
-                return True, "ADB ready with connected device"
-            else:
-                return False, "No device connected to ADB"
-        except:
-            return False, "ADB connection failed"
+        _CAPABILITY_CACHE["adb"] = status
+        return status
 
     def get_available_methods(self):
         """Get list of available merge methods with their status"""
         methods = []
 
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            java_future = executor.submit(self.check_java)
+            adb_future = executor.submit(self.check_adb)
+            apkeditor_future = executor.submit(self.find_apkeditor)
+            uber_signer_future = executor.submit(self.find_uber_signer)
+
+            java_available = java_future.result()
+            adb_available, adb_status = adb_future.result()
+            apkeditor_path = apkeditor_future.result()
+            uber_signer_path = uber_signer_future.result()
+
         methods.append(
             {
                 "id": 1,
@@ -541,8 +702,6 @@ class CapabilityChecker:
             }
         )
 
-        java_available = self.check_java()
-        apkeditor_path = self.find_apkeditor()
         apkeditor_available = java_available and apkeditor_path is not None
 
         status = "Ready" if apkeditor_available else []
@@ -562,7 +721,6 @@ class CapabilityChecker:
             }
         )
 
-        adb_available, adb_status = self.check_adb()
         methods.append(
             {
                 "id": 4,
@@ -573,8 +731,6 @@ class CapabilityChecker:
             }
         )
 
-        uber_signer_path = self.find_uber_signer()
-
         if uber_signer_path and java_available:
             full_merge_available = True
             status = "Ready with Uber APK Signer"
@@ -599,12 +755,17 @@ class CapabilityChecker:
 
 
 class ProgressBar:
+    BAR_LENGTH = 30
+    _BAR_CACHE = ["█" * i + "░" * (30 - i) for i in range(31)]
+    _PER_MB = 1 / (1024 * 1024)
+
     def __init__(self, total_size, filename):
         self.total_size = total_size
         self.filename = filename
         self.downloaded = 0
         self.start_time = time.time()
         self.last_update = 0
+        self.total_mb = total_size * self._PER_MB
 
     def update(self, chunk_size):
         self.downloaded += chunk_size
@@ -618,32 +779,230 @@ class ProgressBar:
             speed = self.downloaded / (current_time - self.start_time)
 
             speed_str = (
-                f"{speed/1024/1024:.1f} MB/s"
+                f"{speed * self._PER_MB:.1f} MB/s"
                 if speed > 1024 * 1024
-                else f"{speed/1024:.1f} KB/s"
+                else f"{speed / 1024:.1f} KB/s"
             )
-            downloaded_mb = self.downloaded / 1024 / 1024
-            total_mb = self.total_size / 1024 / 1024
+            downloaded_mb = self.downloaded * self._PER_MB
 
-            bar_length = 30
-            filled_length = int(bar_length * progress / 100)
-            bar = "█" * filled_length + "░" * (bar_length - filled_length)
+            filled_length = min(
+                self.BAR_LENGTH, int(self.BAR_LENGTH * progress / 100)
+            )
+            bar = self._BAR_CACHE[filled_length]
 
-            print(
-                f"\r{self.filename}: [{bar}] {progress:.1f}% ({downloaded_mb:.1f}/{total_mb:.1f}MB) {speed_str}",
-                end="",
+            sys.stdout.write(
+                f"\r{self.filename}: [{bar}] {progress:.1f}% ({downloaded_mb:.1f}/{self.total_mb:.1f}MB) {speed_str}"
             )
+            sys.stdout.flush()
 
     def finish(self):
         print()
 
 
+class _NullProgress:
+    """Progress sink for downloads that must not draw on the terminal"""
+
+    def update(self, chunk_size):
+        pass
+
+    def finish(self):
+        pass
+
+
+_NULL_PROGRESS = _NullProgress()
+
+
+class _LockedProgress:
+    """Serialize ProgressBar updates coming from concurrent workers"""
+
+    def __init__(self, progress):
+        self.progress = progress
+        self.lock = threading.Lock()
+
+    def update(self, chunk_size):
+        with self.lock:
+            self.progress.update(chunk_size)
+
+    def finish(self):
+        self.progress.finish()
+
+
+class _ProgressWriter:
+    """File-like wrapper that reports written bytes to a ProgressBar
+
+    Updates are batched to ~1 MiB / 10 Hz so the progress accounting
+    stays out of the hot copy loop.
+    """
+
+    FLUSH_BYTES = 1024 * 1024
+    FLUSH_SECONDS = 0.1
+
+    def __init__(self, fileobj, progress):
+        self.fileobj = fileobj
+        self.progress = progress
+        self.pending = 0
+        self.last_flush = time.monotonic()
+
+    def write(self, data):
+        written = self.fileobj.write(data)
+        self.pending += len(data)
+
+        now = time.monotonic()
+        if self.pending >= self.FLUSH_BYTES or now - self.last_flush > self.FLUSH_SECONDS:
+            self.progress.update(self.pending)
+            self.pending = 0
+            self.last_flush = now
+        return written
+
+
+def _splice_download(response, fileobj, total_size, progress):
+    """Copy a response body into a file with kernel-space splice (Linux)
+
+    Returns False without consuming the response when the transfer can't
+    be spliced (non-Linux, TLS, encoded/chunked body, no usable fds);
+    errors mid-transfer propagate like any other download failure.
+    """
+    if sys.platform != "linux" or not hasattr(os, "splice") or total_size <= 0:
+        return False
+    if response.headers.get("content-encoding"):
+        return False
+    if "chunked" in response.headers.get("transfer-encoding", "").lower():
+        return False
+    # Belt and braces alongside the SSLSocket check below: the socket
+    # attributes are private urllib3/http.client internals, and splicing a
+    # TLS stream writes ciphertext, so refuse by final URL scheme too.
+    if not (response.url or "").lower().startswith("http://"):
+        return False
+
+    try:
+        buffered = response.raw._fp.fp
+        # The raw fd of a TLS connection carries ciphertext; splicing it
+        # would write TLS record bytes into the file. Decryption happens in
+        # userspace, so HTTPS bodies must take the regular copy path.
+        if isinstance(getattr(buffered.raw, "_sock", None), ssl.SSLSocket):
+            return False
+        src_fd = buffered.raw.fileno()
+        dst_fd = fileobj.fileno()
+    except (AttributeError, OSError, ValueError):
+        return False
+
+    remaining = total_size
+
+    # Drain everything Python already buffered past the headers before
+    # touching the fd. read1 serves from the buffer without a raw read
+    # while it's non-empty, so a short return means the buffer is dry.
+    head_size = max(DOWNLOAD_CHUNK_SIZE, io.DEFAULT_BUFFER_SIZE)
+    while remaining > 0:
+        head = buffered.read1(min(head_size, remaining))
+        if not head:
+            break
+        fileobj.write(head)
+        remaining -= len(head)
+        progress.update(len(head))
+        if len(head) < head_size:
+            break
+    fileobj.flush()
+
+    read_fd, write_fd = os.pipe()
+    try:
+        while remaining > 0:
+            try:
+                moved = os.splice(
+                    src_fd, write_fd, min(remaining, DOWNLOAD_CHUNK_SIZE)
+                )
+            except BlockingIOError:
+                # Sockets with a timeout are non-blocking; wait for data
+                # instead of treating an empty receive buffer as an error.
+                if not select.select([src_fd], [], [], 30)[0]:
+                    raise OSError("timed out waiting for download data")
+                continue
+            if moved == 0:
+                raise OSError("connection closed before download completed")
+
+            while moved > 0:
+                written = os.splice(read_fd, dst_fd, moved)
+                moved -= written
+                remaining -= written
+                progress.update(written)
+    finally:
+        os.close(read_fd)
+        os.close(write_fd)
+
+    response.close()
+    return True
+
+
+def _link_or_copy(src, dst):
+    """Hardlink a file into place, falling back to symlink then copy"""
+    try:
+        os.link(src, dst)
+    except OSError:
+        try:
+            os.symlink(os.path.abspath(src), dst)
+        except OSError:
+            shutil.copy2(src, dst)
+
+
+def _write_file_to_zip(zf, path, arcname):
+    """Add a file to an open zip archive, reading the source via mmap"""
+    info = zipfile.ZipInfo.from_file(path, arcname)
+    with open(path, "rb") as src, zf.open(info, "w") as dst:
+        try:
+            with mmap.mmap(src.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                dst.write(mm)
+        except (ValueError, OSError):
+
+            shutil.copyfileobj(src, dst, length=DOWNLOAD_CHUNK_SIZE)
+
+
+def _copy_zip_entry(src_zip, info, dst_zip):
+    """Copy a zip entry into another archive without recompressing it"""
+    src = src_zip.fp
+    src.seek(info.header_offset + 26)
+    header = src.read(4)
+    name_len = int.from_bytes(header[0:2], "little")
+    extra_len = int.from_bytes(header[2:4], "little")
+    data_start = info.header_offset + 30 + name_len + extra_len
+
+    if isinstance(src, mmap.mmap):
+
+        raw_data = memoryview(src)[data_start : data_start + info.compress_size]
+    else:
+        src.seek(data_start)
+        raw_data = src.read(info.compress_size)
+
+    new_info = zipfile.ZipInfo(info.filename, date_time=info.date_time)
+    new_info.compress_type = info.compress_type
+    new_info.external_attr = info.external_attr
+    new_info.internal_attr = info.internal_attr
+    new_info.create_system = info.create_system
+    new_info.CRC = info.CRC
+    new_info.compress_size = info.compress_size
+    new_info.file_size = info.file_size
+
+    new_info.flag_bits = info.flag_bits & ~0x08
+
+    zip64 = (
+        new_info.file_size > zipfile.ZIP64_LIMIT
+        or new_info.compress_size > zipfile.ZIP64_LIMIT
+    )
+    new_info.header_offset = dst_zip.fp.tell()
+    dst_zip.fp.write(new_info.FileHeader(zip64=zip64))
+    dst_zip.fp.write(raw_data)
+    if isinstance(raw_data, memoryview):
+        raw_data.release()
+    dst_zip.filelist.append(new_info)
+    dst_zip.NameToInfo[new_info.filename] = new_info
+    dst_zip.start_dir = dst_zip.fp.tell()
+    dst_zip._didModify = True
+
+
 class SplitManager:
-    def __init__(self, package_name):
+    def __init__(self, package_name, checker=None):
         self.package_name = package_name
         self.base_apk = None
         self.splits = []
-        self.checker = CapabilityChecker()
+        self.checker = checker or CapabilityChecker()
 
     def add_files(self, base_apk, splits):
         self.base_apk = base_apk
@@ -725,12 +1084,12 @@ class SplitManager:
         output = f"{self.package_name}.xapk"
         print(f"Creating XAPK: {output}")
 
-        with zipfile.ZipFile(output, "w") as xapk:
+        with zipfile.ZipFile(output, "w", zipfile.ZIP_STORED) as xapk:
             if self.base_apk:
-                xapk.write(self.base_apk, "base.apk")
+                _write_file_to_zip(xapk, self.base_apk, "base.apk")
 
             for i, split in enumerate(self.splits):
-                xapk.write(split, f"config.{i}.apk")
+                _write_file_to_zip(xapk, split, f"config.{i}.apk")
 
             manifest = {
                 "xapk_version": 2,
@@ -746,12 +1105,12 @@ class SplitManager:
         output = f"{self.package_name}.apks"
         print(f"Creating APKS: {output}")
 
-        with zipfile.ZipFile(output, "w") as apks:
+        with zipfile.ZipFile(output, "w", zipfile.ZIP_STORED) as apks:
             if self.base_apk:
-                apks.write(self.base_apk, "base-master.apk")
+                _write_file_to_zip(apks, self.base_apk, "base-master.apk")
 
             for i, split in enumerate(self.splits):
-                apks.write(split, f"base-{i}.apk")
+                _write_file_to_zip(apks, split, f"base-{i}.apk")
 
         print(f"✓ Created: {output}")
         return output
@@ -765,10 +1124,10 @@ class SplitManager:
         with tempfile.TemporaryDirectory() as temp_dir:
 
             if self.base_apk:
-                shutil.copy2(self.base_apk, os.path.join(temp_dir, "base.apk"))
+                _link_or_copy(self.base_apk, os.path.join(temp_dir, "base.apk"))
 
             for i, split in enumerate(self.splits):
-                shutil.copy2(split, os.path.join(temp_dir, f"split_{i}.apk"))
+                _link_or_copy(split, os.path.join(temp_dir, f"split_{i}.apk"))
 
             output = f"{self.package_name}_merged.apk"
             cmd = ["java", "-jar", apkeditor, "m", "-i", temp_dir, "-o", output]
@@ -800,21 +1159,27 @@ class SplitManager:
             print("🔧 Merging APK splits using ZIP manipulation...")
 
             with zipfile.ZipFile(
-                merged_output, "w", zipfile.ZIP_DEFLATED
+                merged_output, "w", zipfile.ZIP_STORED
             ) as merged_zip:
 
+                seen = set()
+
                 if self.base_apk and os.path.exists(self.base_apk):
-                    with zipfile.ZipFile(self.base_apk, "r") as base_zip:
+                    with open(self.base_apk, "rb") as base_f, mmap.mmap(
+                        base_f.fileno(), 0, access=mmap.ACCESS_READ
+                    ) as base_mm, zipfile.ZipFile(base_mm, "r") as base_zip:
                         for file_info in base_zip.infolist():
 
                             if not file_info.filename.startswith("META-INF/"):
-                                file_data = base_zip.read(file_info.filename)
-                                merged_zip.writestr(file_info, file_data)
+                                _copy_zip_entry(base_zip, file_info, merged_zip)
+                                seen.add(file_info.filename)
 
                 for i, split_file in enumerate(self.splits):
                     if os.path.exists(split_file):
                         print(f"  📦 Processing split {i+1}/{len(self.splits)}")
-                        with zipfile.ZipFile(split_file, "r") as split_zip:
+                        with open(split_file, "rb") as split_f, mmap.mmap(
+                            split_f.fileno(), 0, access=mmap.ACCESS_READ
+                        ) as split_mm, zipfile.ZipFile(split_mm, "r") as split_zip:
                             for file_info in split_zip.infolist():
 
                                 if (
@@ -822,16 +1187,14 @@ class SplitManager:
                                     and file_info.filename != "AndroidManifest.xml"
                                 ):
 
-                                    try:
-
-                                        merged_zip.getinfo(file_info.filename)
+                                    if file_info.filename in seen:
                                         print(
                                             f"    ⚠️  Skipping duplicate: {file_info.filename}"
                                         )
-                                    except KeyError:
+                                        continue
 
-                                        file_data = split_zip.read(file_info.filename)
-                                        merged_zip.writestr(file_info, file_data)
+                                    _copy_zip_entry(split_zip, file_info, merged_zip)
+                                    seen.add(file_info.filename)
 
             print("✅ APK merge completed")
 
@@ -901,26 +1264,108 @@ class SplitManager:
 
 
 class Downloader:
-    def __init__(self):
-        self.chunk_size = 8192
+    RANGE_WORKERS = 4
+    RANGE_MIN_SIZE = 8 * 1024 * 1024
+
+    def __init__(self, checker=None):
+        self.chunk_size = DOWNLOAD_CHUNK_SIZE
         self.max_retries = 3
+        self.checker = checker or CapabilityChecker()
+        self.session = requests.Session()
+        adapter = requests.adapters.HTTPAdapter(
+            pool_connections=8, pool_maxsize=16, max_retries=0
+        )
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        self.executor = ThreadPoolExecutor(max_workers=8)
+
+    def _download_ranges(self, url, filename, total_size):
+        """Download a file as concurrent byte-range streams"""
+        progress = _LockedProgress(ProgressBar(total_size, filename))
+        part_size = total_size // self.RANGE_WORKERS
+
+        ranges = [
+            (i * part_size, (i + 1) * part_size - 1)
+            for i in range(self.RANGE_WORKERS - 1)
+        ]
+        ranges.append(((self.RANGE_WORKERS - 1) * part_size, total_size - 1))
+
+        with open(filename, "wb") as file:
+            file.truncate(total_size)
+
+        def fetch_range(start, end):
+            response = self.session.get(
+                url,
+                headers={"Range": f"bytes={start}-{end}"},
+                stream=True,
+                timeout=30,
+            )
+            if response.status_code != 206:
+                raise ValueError(f"server ignored range request ({response.status_code})")
+            response.raw.decode_content = True
+
+            with open(filename, "r+b") as file:
+                file.seek(start)
+                shutil.copyfileobj(
+                    response.raw,
+                    _ProgressWriter(file, progress),
+                    length=self.chunk_size,
+                )
+
+        try:
+            with ThreadPoolExecutor(max_workers=self.RANGE_WORKERS) as executor:
+                futures = [executor.submit(fetch_range, s, e) for s, e in ranges]
+                for future in futures:
+                    future.result()
+
+            progress.finish()
+            return True
+        except Exception as e:
+            print(f"\nRange download failed, falling back: {e}")
+            return False
 
     def download_file(self, url, filename):
         for attempt in range(self.max_retries):
             try:
-                response = requests.head(url, timeout=10)
+                response = self.session.head(url, timeout=10)
                 total_size = int(response.headers.get("content-length", 0))
 
-                response = requests.get(url, stream=True, timeout=30)
+                if (
+                    total_size > self.RANGE_MIN_SIZE
+                    and response.headers.get("accept-ranges", "").lower() == "bytes"
+                    and self._download_ranges(url, filename, total_size)
+                ):
+                    return True
+
+                response = self.session.get(url, stream=True, timeout=30)
                 response.raise_for_status()
 
+                # The GET response is authoritative: a redirect or mirror
+                # inconsistency can make its length differ from the HEAD
+                # probe, and splice trusts this as the exact body size.
+                total_size = int(response.headers.get("content-length", 0))
+
                 progress = ProgressBar(total_size, filename)
 
-                with open(filename, "wb") as file:
-                    for chunk in response.iter_content(chunk_size=self.chunk_size):
-                        if chunk:
-                            file.write(chunk)
-                            progress.update(len(chunk))
+                response.raw.decode_content = True
+
+                with open(filename, "wb", buffering=self.chunk_size) as file:
+                    if total_size > 0:
+                        try:
+                            # Reserve the blocks up front and declare the
+                            # sequential write pattern to the kernel.
+                            os.posix_fallocate(file.fileno(), 0, total_size)
+                            os.posix_fadvise(
+                                file.fileno(), 0, total_size, os.POSIX_FADV_SEQUENTIAL
+                            )
+                        except (AttributeError, OSError):
+                            pass
+                    if not _splice_download(response, file, total_size, progress):
+                        shutil.copyfileobj(
+                            response.raw,
+                            _ProgressWriter(file, progress),
+                            length=self.chunk_size,
+                        )
 
                 progress.finish()
                 return True
@@ -928,7 +1373,9 @@ class Downloader:
             except Exception as e:
                 if attempt < self.max_retries - 1:
                     print(f"Retry {attempt + 1}...")
-                    time.sleep(1)
+                    # Exponential backoff with jitter so retries don't hammer
+                    # a struggling CDN in lockstep.
+                    time.sleep(min(30, 2**attempt) * (0.5 + random.random()))
                 else:
                     print(f"Download failed: {e}")
                     return False
@@ -958,19 +1405,18 @@ class Downloader:
         if splits:
             print(f"Downloading {len(splits)} split files...")
 
-            with ThreadPoolExecutor(max_workers=3) as executor:
-                futures = []
+            futures = []
 
-                for i, split in enumerate(splits):
-                    split_filename = f"{package_name}_split_{i}.apk"
-                    future = executor.submit(
-                        self._download_from_urls, split["fullPathUrls"], split_filename
-                    )
-                    futures.append((future, split_filename))
+            for i, split in enumerate(splits):
+                split_filename = f"{package_name}_split_{i}.apk"
+                future = self.executor.submit(
+                    self._download_from_urls, split["fullPathUrls"], split_filename
+                )
+                futures.append((future, split_filename))
 
-                for future, filename in futures:
-                    if future.result():
-                        split_files.append(filename)
+            for future, filename in futures:
+                if future.result():
+                    split_files.append(filename)
 
         return self._handle_merge_or_rename(
             base_filename, split_files, package_name, merge_method
@@ -991,22 +1437,21 @@ class Downloader:
         if splits:
             print(f"Downloading {len(splits)} Myket split files...")
 
-            with ThreadPoolExecutor(max_workers=3) as executor:
-                futures = []
-
-                for i, split in enumerate(splits):
-                    split_filename = f"{package_name}_{split['type']}"
-                    split_urls = [
-                        server + split["uriPath"] for server in split["uriServers"]
-                    ]
-                    future = executor.submit(
-                        self._download_from_urls, split_urls, split_filename
-                    )
-                    futures.append((future, split_filename))
+            futures = []
 
-                for future, filename in futures:
-                    if future.result():
-                        split_files.append(filename)
+            for i, split in enumerate(splits):
+                split_filename = f"{package_name}_{split['type']}"
+                split_urls = [
+                    server + split["uriPath"] for server in split["uriServers"]
+                ]
+                future = self.executor.submit(
+                    self._download_from_urls, split_urls, split_filename
+                )
+                futures.append((future, split_filename))
+
+            for future, filename in futures:
+                if future.result():
+                    split_files.append(filename)
 
         return self._handle_merge_or_rename(
             base_filename, split_files, package_name, merge_method
@@ -1016,29 +1461,67 @@ class Downloader:
         self, base_filename, split_files, package_name, merge_method
     ):
         if split_files:
-            manager = SplitManager(package_name)
+            manager = SplitManager(package_name, checker=self.checker)
             manager.add_files(base_filename, split_files)
             result = manager.merge(merge_method)
             return result is not None
         else:
             final_name = f"{package_name}.apk"
-            os.rename(base_filename, final_name)
+            os.replace(base_filename, final_name)
             print(f"✓ Downloaded: {final_name}")
             return True
 
+    def _probe_url(self, url):
+        """Cheap range probe to find a responsive mirror"""
+        try:
+            response = self.session.get(
+                url, headers={"Range": "bytes=0-0"}, stream=True, timeout=10
+            )
+            ok = response.status_code in (200, 206)
+            response.close()
+            return ok
+        except Exception:
+            return False
+
     def _download_from_urls(self, urls, filename):
-        return any(self.download_file(url, filename) for url in urls)
+        winner = None
+
+        if len(urls) > 1:
+            executor = ThreadPoolExecutor(max_workers=3)
+            futures = {executor.submit(self._probe_url, url): url for url in urls}
+
+            for future in as_completed(futures):
+                if future.result():
+                    winner = futures[future]
+                    break
+
+            # Commit to the first responder: cancel queued probes and let
+            # in-flight ones drain while the transfer runs.
+            executor.shutdown(wait=False, cancel_futures=True)
+
+        if winner and self.download_file(winner, filename):
+            return True
+
+        return any(
+            self.download_file(url, filename) for url in urls if url != winner
+        )
 
 
 class Main:
     def __init__(self, architecture="arm64", store_preference="both"):
         self.architecture = architecture
         self.arch_config = ARCHITECTURES[architecture]
+        self.arch_tag = self.arch_config["tag"]
+        self.arch_cpu = self.arch_config["cpu"]
         self.store_preference = store_preference
+        self.store_label = STORES[store_preference]
         self.config_dir = get_user_config_dir()
         self.config_path = self.config_dir / "config.json"
         self.menu = InteractiveMenu()
         self.installer = ToolInstaller()
+        self.checker = CapabilityChecker()
+        self.bazaar = Bazaar(self.arch_cpu)
+        self.downloader = Downloader(self.checker)
         self.first_run_check()
         self.load_config()
 
@@ -1082,15 +1565,38 @@ class Main:
 
     def search(self, query):
         print(f"Searching for: {query}")
-        print(f"Architecture: {self.architecture} - {self.arch_config['tag']}")
-        print(f"Store: {STORES[self.store_preference]}")
+        print(f"Architecture: {self.architecture} - {self.arch_tag}")
+        print(f"Store: {self.store_label}")
         print("-" * 50)
 
         results = {}
 
-        if self.store_preference in ["both", "myket"]:
-            try:
-                myket_results = self.myket.search(query)
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            myket_future = (
+                executor.submit(self.myket.search, query)
+                if self.store_preference in ["both", "myket"]
+                else None
+            )
+            bazaar_future = (
+                executor.submit(self.bazaar.search, query)
+                if self.store_preference in ["both", "bazaar"]
+                else None
+            )
+
+            if myket_future:
+                myket_results = {}
+                try:
+                    myket_results = myket_future.result()
+                except Exception as e:
+                    print(f"Myket search failed: {e}")
+                    print("Re-obtaining Myket session...")
+                    self.myket = Myket(None, self.arch_config["abis"])
+                    try:
+                        myket_results = self.myket.search(query)
+                        print("Myket session re-obtained successfully")
+                    except Exception as retry_e:
+                        print(f"Myket retry failed: {retry_e}")
+
                 for pkg, info in myket_results.items():
                     results[pkg] = {
                         "name": info["name"],
@@ -1098,39 +1604,23 @@ class Main:
                         "bazaar_version": None,
                         "store": "Myket",
                     }
-            except Exception as e:
-                print(f"Myket search failed: {e}")
-                print("Re-obtaining Myket session...")
-                self.myket = Myket(None, self.arch_config["abis"])
+
+            if bazaar_future:
                 try:
-                    myket_results = self.myket.search(query)
-                    for pkg, info in myket_results.items():
-                        results[pkg] = {
-                            "name": info["name"],
-                            "myket_version": info["version"],
-                            "bazaar_version": None,
-                            "store": "Myket",
-                        }
-                    print("Myket session re-obtained successfully")
-                except Exception as retry_e:
-                    print(f"Myket retry failed: {retry_e}")
-
-        if self.store_preference in ["both", "bazaar"]:
-            try:
-                bazaar_results = Bazaar(self.arch_config["cpu"]).search(query)
-                for pkg, info in bazaar_results.items():
-                    if pkg in results:
-                        results[pkg]["bazaar_version"] = info["version"]
-                        results[pkg]["store"] = "Both"
-                    else:
-                        results[pkg] = {
-                            "name": info["name"],
-                            "myket_version": None,
-                            "bazaar_version": info["version"],
-                            "store": "Bazaar",
-                        }
-            except Exception as e:
-                print(f"Bazaar search failed: {e}")
+                    bazaar_results = bazaar_future.result()
+                    for pkg, info in bazaar_results.items():
+                        if pkg in results:
+                            results[pkg]["bazaar_version"] = info["version"]
+                            results[pkg]["store"] = "Both"
+                        else:
+                            results[pkg] = {
+                                "name": info["name"],
+                                "myket_version": None,
+                                "bazaar_version": info["version"],
+                                "store": "Bazaar",
+                            }
+                except Exception as e:
+                    print(f"Bazaar search failed: {e}")
 
         return results
 
@@ -1208,7 +1698,7 @@ class Main:
 
     def download(self, package_name, merge_method=None, store_choice=None):
         print(f"\nGetting download links for: {package_name}")
-        print(f"Architecture: {self.architecture} - {self.arch_config['tag']}")
+        print(f"Architecture: {self.architecture} - {self.arch_tag}")
 
         if store_choice == "myket":
             stores_to_try = ["myket"]
@@ -1225,16 +1715,11 @@ class Main:
             if store == "bazaar":
                 try:
                     print("Trying Bazaar...")
-                    bazaar_info = Bazaar(self.arch_config["cpu"]).get_download_link(
-                        package_name
-                    )
-                    if isinstance(bazaar_info, dict) and not bazaar_info.get(
-                        "translatedMessage"
-                    ):
+                    bazaar_result = self.bazaar.get_download_link(package_name)
+                    if bazaar_result.success:
                         print("Found Bazaar download info")
-                        downloader = Downloader()
-                        if downloader.download_app(
-                            bazaar_info, package_name, merge_method
+                        if self.downloader.download_app(
+                            bazaar_result.info, package_name, merge_method
                         ):
                             return
                 except Exception as e:
@@ -1243,21 +1728,18 @@ class Main:
             elif store == "myket":
                 try:
                     print("Trying Myket...")
-                    myket_info = self.myket.get_download_link(package_name)
-                    if (
-                        isinstance(myket_info, dict)
-                        and myket_info.get("resultCode") == "Successful"
-                    ):
+                    myket_result = self.myket.get_download_link(package_name)
+                    if myket_result.success and myket_result.info is not None:
                         print("Found Myket download info")
-                        downloader = Downloader()
-                        if downloader.download_app(
-                            myket_info, package_name, merge_method
+                        if self.downloader.download_app(
+                            myket_result.info, package_name, merge_method
                         ):
                             return
-                    elif isinstance(myket_info, list):
-                        downloader = Downloader()
+                    elif myket_result.success:
                         filename = f"{package_name}.apk"
-                        if downloader._download_from_urls(myket_info, filename):
+                        if self.downloader._download_from_urls(
+                            myket_result.urls, filename
+                        ):
                             print(f"✓ Downloaded: {filename}")
                             return
                 except Exception as e:
@@ -1266,12 +1748,23 @@ class Main:
         print("All sources failed")
 
 
+@dataclass
+class DownloadResult:
+    """Normalized outcome of a store's get_download_link call"""
+
+    success: bool
+    info: dict = None
+    urls: list = None
+    message: str = None
+
+
 class Bazaar:
     def __init__(self, cpu="arm64-v8a,armeabi-v7a,armeabi"):
         self.cpu = cpu
+        self.session = requests.Session()
 
     def get_download_link(self, package_name):
-        response = requests.post(
+        response = self.session.post(
             "https://api.cafebazaar.ir/rest-v1/process/AppDownloadInfoRequest",
             json={
                 "properties": {
@@ -1287,14 +1780,16 @@ class Bazaar:
             },
         ).json()
 
-        return (
-            response["properties"]["errorMessage"]
-            if response["properties"]
-            else response["singleReply"]["appDownloadInfoReply"]
+        if response["properties"]:
+            return DownloadResult(
+                success=False, message=response["properties"]["errorMessage"]
+            )
+        return DownloadResult(
+            success=True, info=response["singleReply"]["appDownloadInfoReply"]
         )
 
     def search(self, query, offset=0):
-        response = requests.post(
+        response = self.session.post(
             "https://api.cafebazaar.ir/rest-v1/process/SearchBodyV2Request",
             headers={
                 "User-Agent": "Bazaar/2600200 (Android 35; Xiaomi 2311DRK48G)",
@@ -1310,38 +1805,54 @@ class Bazaar:
                     }
                 }
             },
-        ).json()
+        )
+        response = _json_loads(response.content)
 
         if response.get("properties", {}).get("errorMessage"):
             return {}
 
-        results = {}
-        for item in response["singleReply"]["searchBodyV2Reply"]["pageBody"]["rows"]:
-            if (
-                not item.get("appItemWithCustomDetail")
-                or item["appItemWithCustomDetail"]["isAd"]
-            ):
-                continue
-            info = item["appItemWithCustomDetail"]["info"]
-            results[info["packageName"]] = {
+        return {
+            (info := detail["info"])["packageName"]: {
                 "name": info["name"],
                 "version": info["versionCode"],
             }
-        return results
+            for item in response["singleReply"]["searchBodyV2Reply"]["pageBody"]["rows"]
+            if (detail := item.get("appItemWithCustomDetail")) and not detail["isAd"]
+        }
 
 
 class Myket:
     AES_KEY = bytes.fromhex("51863A124995CA387F6199A397582D7E")
     SALT_HASH = b"NZe*x:38_Jh@#LM6)!9&wb5:32D"
     UUID = str(uuid.uuid4()).encode()
+    # SALT_HASH and UUID are fixed for the process, so the auth digest is too
+    _AUTH_HSH = sha1(b"-".join([SALT_HASH, UUID, b"", b"", b""])).hexdigest()
 
     def __init__(self, token=None, supported_abis=None):
         self.session = requests.Session()
         self.session.headers.update({"Myket-Version": "963"})
         self.supported_abis = supported_abis or ["arm64-v8a", "armeabi-v7a", "armeabi"]
-        self.servers = self.get_servers()
-        self.token = token if token else self.auth()
-        self.session.headers.update({"Authorization": self.token})
+        if token:
+            # A known token overrides the lazy cached_property below, so a
+            # warm start does no network I/O at all.
+            self.token = token
+            self.session.headers.update({"Authorization": token})
+
+    @functools.cached_property
+    def servers(self):
+        return self.get_servers()
+
+    @functools.cached_property
+    def _asl_bases(self):
+        # API servers are listed with a "/v1" suffix; strip it once instead
+        # of slicing on every request.
+        return [server[:-3] for server in self.servers["asl"]]
+
+    @functools.cached_property
+    def token(self):
+        token = self.auth()
+        self.session.headers.update({"Authorization": token})
+        return token
 
     def auth(self):
         data = {
@@ -1350,9 +1861,7 @@ class Myket:
             "api": "33",
             "adId": "de46304b-89ac-4ffa-a9bf-4ecc9ee9c857",
             "andId": "8f2ff66584cc50ef",
-            "hsh": sha1(
-                b"-".join([self.SALT_HASH, self.UUID, b"", b"", b""])
-            ).hexdigest(),
+            "hsh": self._AUTH_HSH,
             "supportedAbis": self.supported_abis,
             "uuid": self.UUID.decode(),
         }
@@ -1364,33 +1873,34 @@ class Myket:
         return self.session.get("https://apiserver.myket.ir/v1/apiservers/").json()
 
     def search(self, query, offset=0):
+        self.token  # first access authorizes the session
         response = self.session.get(
-            random.choice(self.servers["asl"])[:-3] + "/v2/applications/search/",
+            random.choice(self._asl_bases) + "/v2/applications/search/",
             params={"limit": 20, "offset": offset, "query": query, "tab": "app_app"},
-        ).json()
+        )
+        response = _json_loads(response.content)
 
-        results = {}
-        for item in response["items"]:
-            if item["app"]["application"].get("adInfo", False):
-                continue
-            app = item["app"]["application"]
-            results[app["packageName"]] = {
+        return {
+            app["packageName"]: {
                 "name": app["englishTitle"],
                 "version": app["versionCode"],
             }
-        return results
+            for item in response["items"]
+            if not (app := item["app"]["application"]).get("adInfo", False)
+        }
 
     def get_download_link(self, package_name):
+        self.token  # first access authorizes the session
         info = self.session.get(
-            random.choice(self.servers["asl"])[:-3] + f"/v2/applications/{package_name}"
+            random.choice(self._asl_bases) + f"/v2/applications/{package_name}"
         ).json()
 
         if info.get("translatedMessage"):
-            return info["translatedMessage"]
+            return DownloadResult(success=False, message=info["translatedMessage"])
 
         version = info["version"]["code"]
         uri_info = self.session.post(
-            random.choice(self.servers["asl"])[:-3]
+            random.choice(self._asl_bases)
             + f"/v2/applications/{package_name}/uri",
             json={"requestedVersion": version},
         ).json()
@@ -1398,14 +1908,18 @@ class Myket:
         if uri_info.get("resultCode") == "Successful" and (
             "split" in uri_info or "uriPath" in uri_info
         ):
-            return uri_info
+            return DownloadResult(success=True, info=uri_info)
 
         if "uriServers" in uri_info and "uriPath" in uri_info:
-            return [
-                server[:-1] + uri_info["uriPath"] for server in uri_info["uriServers"]
-            ]
+            return DownloadResult(
+                success=True,
+                urls=[
+                    server[:-1] + uri_info["uriPath"]
+                    for server in uri_info["uriServers"]
+                ],
+            )
 
-        return "No download links found"
+        return DownloadResult(success=False, message="No download links found")
 
 
 def choose_architecture():